@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
+import json
 import logging
 from abc import ABC
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from nmdc_api_utilities import __version__ as package_version
 from nmdc_api_utilities.config import API_BASE_URL, get_api_base_url
@@ -11,6 +15,9 @@ from nmdc_api_utilities.decorators import has_deprecated_parameter
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 @has_deprecated_parameter("env", reason="Use ``api_base_url`` instead.")
 class NMDCAPIClient(ABC):
@@ -27,6 +34,148 @@ class NMDCAPIClient(ABC):
 
     def __init__(self, api_base_url: str = API_BASE_URL, env: str = ""):
         self.api_base_url = get_api_base_url(api_base_url=api_base_url, env=env)
+        # Send all of this instance's HTTP requests through a single session, so that consecutive
+        # requests reuse pooled keep-alive connections instead of each one opening a new TCP+TLS
+        # connection to the API.
+        self._session = self._build_http_session()
+        # Identify this package (via the "User-Agent" header) on every request the session sends.
+        self._session.headers.update(self._build_http_request_headers())
+        self._session_access_token: Optional[str] = None
+        # Responses to GET requests whose validators (`ETag`/`Last-Modified`) we can send back to
+        # the server, keyed by URL and query parameters. See `_conditional_get`.
+        self._conditional_get_cache: OrderedDict[tuple, requests.Response] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _build_http_session(pool_maxsize: int = 32) -> requests.Session:
+        """
+        Builds an HTTP session that pools connections and retries idempotent requests (e.g. GET)
+        that fail with a transient error, waiting exponentially longer between attempts (or as
+        long as the server asks, via a ``Retry-After`` header).
+
+        >>> from nmdc_api_utilities.api_client import NMDCAPIClient
+        >>> session = NMDCAPIClient._build_http_session()
+        >>> adapter = session.get_adapter("https://api.microbiomedata.org")
+        >>> adapter.max_retries.total
+        5
+        >>> sorted(adapter.max_retries.status_forcelist)
+        [429, 500, 502, 503, 504]
+        """
+
+        # Note: We set `raise_on_status=False` so that, once the retries are used up, the final
+        #       response is returned (and `response.raise_for_status()` raises as usual) instead of
+        #       `requests` raising a `RetryError`.
+        # Note: We leave `allowed_methods` at its default, which only includes idempotent methods.
+        #       Retrying a POST (or PATCH) whose response was lost could apply it twice.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _set_session_access_token(self, access_token: str) -> None:
+        """
+        Makes this instance's HTTP session send the specified access token with every request.
+
+        The ``Authorization`` header is only rebuilt when the token differs from the one the
+        session is already sending (e.g. after the token has been refreshed).
+        """
+        if access_token != self._session_access_token:
+            self._session.headers.update(
+                self._build_http_request_headers(access_token=access_token)
+            )
+            self._session_access_token = access_token
+
+    def _conditional_get(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        max_cache_size: int = 128,
+    ) -> requests.Response:
+        """
+        Sends a GET request through this instance's session, revalidating any previous response
+        to the same request instead of downloading it again.
+
+        If an earlier response to the same URL and query parameters included an ``ETag`` or
+        ``Last-Modified`` header, that validator is sent back in an ``If-None-Match`` or
+        ``If-Modified-Since`` header. If the server responds with ``304 Not Modified``, the
+        earlier response is returned. Up to ``max_cache_size`` responses are kept, with the least
+        recently used ones discarded first.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        cached_response = self._conditional_get_cache.get(key)
+        headers = {}
+        if cached_response is not None:
+            if "ETag" in cached_response.headers:
+                headers["If-None-Match"] = cached_response.headers["ETag"]
+            if "Last-Modified" in cached_response.headers:
+                headers["If-Modified-Since"] = cached_response.headers["Last-Modified"]
+
+        response = self._session.get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached_response is not None:
+            self._conditional_get_cache.move_to_end(key)
+            return cached_response
+
+        if response.status_code == 200 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            self._conditional_get_cache[key] = response
+            self._conditional_get_cache.move_to_end(key)
+            while len(self._conditional_get_cache) > max_cache_size:
+                self._conditional_get_cache.popitem(last=False)
+        return response
+
+    def _map_concurrently(
+        self, func: Callable[[T], R], items: list[T], max_workers: int = 4
+    ) -> list[R]:
+        """
+        Calls ``func`` on each item, running up to ``max_workers`` calls at once, and returns the
+        results in the same order as ``items``.
+
+        This is meant for sending many independent requests through this instance's session, whose
+        connection pool is larger than ``max_workers``. If any call raises an exception, the first
+        such exception (in item order) is re-raised once all calls have finished.
+        """
+        if len(items) <= 1 or max_workers <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _encode_filter(filter: str | dict[str, Any] | None) -> str:
+        """
+        Encodes a MongoDB-style filter for use as the ``filter`` query parameter.
+
+        A filter that is already a string is returned as is, since serializing it again would wrap
+        it in quotes. Other filters are serialized as compact JSON. An empty filter is encoded as
+        an empty string, which callers omit from the query entirely.
+
+        >>> from nmdc_api_utilities.api_client import NMDCAPIClient
+        >>> NMDCAPIClient._encode_filter({"a": {"$ne": 1}})
+        '{"a":{"$ne":1}}'
+        >>> NMDCAPIClient._encode_filter('{"a": 1}')
+        '{"a": 1}'
+        >>> NMDCAPIClient._encode_filter(None)
+        ''
+        """
+        if isinstance(filter, str):
+            return filter
+        if not filter:
+            return ""
+        return json.dumps(filter, separators=(",", ":"))
 
     @staticmethod
     def _build_http_request_headers(
@@ -87,7 +236,8 @@ class NMDCAPIClient(ABC):
         url_prefix: str
             The URL prefix for the API endpoint.
         filter: str
-            The filter to apply to the query. Default is an empty string.
+            The JSON-encoded filter to apply to the query. Default is an empty string, meaning no
+            filter is sent.
         max_page_size: int
             The maximum number of items to return per page. Default is 100.
         fields: str
@@ -107,36 +257,43 @@ class NMDCAPIClient(ABC):
 
         """
 
-        results = response.json()
-
-        while True:
-            if response.json().get("next_page_token"):
-                next_page_token = response.json()["next_page_token"]
-            else:
-                break
+        # Note: The API paginates with opaque page tokens, each of which is only known once the
+        #       previous page has arrived, so the pages are fetched one after another. Each page is
+        #       parsed once and its records are appended in place, rather than re-concatenating
+        #       the (growing) list of records already collected.
+        page = response.json()
+        resources = page["resources"]
+        next_page_token = page.get("next_page_token")
 
-            # Define the HTTP headers, which may include an access token.
-            headers = self._build_http_request_headers(
-                access_token=access_token,
-                accept="application/json",
-                content_type="application/json",
-            )
+        # Define the HTTP headers, which may include an access token.
+        headers = self._build_http_request_headers(
+            access_token=access_token,
+            accept="application/json",
+            content_type="application/json",
+        )
 
+        while next_page_token:
             params = {
-                "filter": filter,
                 "max_page_size": max_page_size,
                 "projection": fields,
                 "page_token": next_page_token,
             }
+            if filter:
+                params["filter"] = filter
             try:
-                response = requests.get(url_prefix, headers=headers, params=params)
+                response = self._session.get(url_prefix, headers=headers, params=params)
                 response.raise_for_status()
             except requests.exceptions.RequestException as e:
                 logger.error("API request failed", exc_info=True)
                 raise RuntimeError("Failed to get collection from NMDC API") from e
             else:
-                logging.debug(
-                    f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-                )
-            results = {"resources": results["resources"] + response.json()["resources"]}
-        return results
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "API request response: %s\n API Status Code: %s",
+                        response.text,
+                        response.status_code,
+                    )
+            page = response.json()
+            resources.extend(page["resources"])
+            next_page_token = page.get("next_page_token")
+        return {"resources": resources}
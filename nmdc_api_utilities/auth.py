@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import base64
+import json
 import logging
 from datetime import datetime, timedelta
 from typing import Any
@@ -140,5 +142,35 @@ class NMDCAuth(NMDCAPIClient):
             self._token_expires_at = (
                 datetime.now() + expires_delta - timedelta(seconds=60)
             )
+        else:
+            # Without an expiry, the token would be treated as expired and refreshed on every call,
+            # so fall back to the expiry encoded in the token itself (if it is a JWT).
+            jwt_expires_at = self._get_jwt_expiry(self._token)
+            if jwt_expires_at is not None:
+                self._token_expires_at = jwt_expires_at - timedelta(seconds=60)
         assert isinstance(self._token, str)  # to appease mypy
         return self._token
+
+    @staticmethod
+    def _get_jwt_expiry(token: str) -> datetime | None:
+        """
+        Get the expiry time encoded in the ``exp`` claim of a JSON Web Token, or ``None`` if the
+        token is not a JWT or has no such claim. The token's signature is not verified.
+
+        >>> import base64, json
+        >>> from nmdc_api_utilities.auth import NMDCAuth
+        >>> payload = base64.urlsafe_b64encode(json.dumps({"exp": 2000000000}).encode())
+        >>> token = "e30." + payload.decode().rstrip("=") + ".signature"
+        >>> NMDCAuth._get_jwt_expiry(token) == datetime.fromtimestamp(2000000000)
+        True
+        >>> NMDCAuth._get_jwt_expiry("not-a-jwt") is None
+        True
+        """
+        try:
+            payload = token.split(".")[1]
+            # Restore the base64 padding that JWTs omit.
+            payload += "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            return datetime.fromtimestamp(claims["exp"])
+        except (IndexError, ValueError, TypeError, KeyError, OverflowError, OSError):
+            return None
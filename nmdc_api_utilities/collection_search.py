@@ -48,6 +48,7 @@ class CollectionSearch(NMDCSearch):
             api_base_url=api_base_url,
             env=env,
         )
+        self._collection_url = f"{self.api_base_url}/nmdcschema/{self.collection_name}"
 
     def get_records(
         self,
@@ -89,26 +90,28 @@ class CollectionSearch(NMDCSearch):
             raise ValueError(
                 f"Invalid shape input: {shape}\n Valid inputs: 'records' or 'dataframe'"
             )
-        url = f"{self.api_base_url}/nmdcschema/{self.collection_name}"
+        url = self._collection_url
         params: dict[str, QueryParamValue] = {
             "filter": filter,
             "max_page_size": max_page_size,
             "projection": fields,
         }
         try:
-            response = requests.get(
+            response = self._session.get(
                 url=url,
                 params=params,
-                headers=self._build_http_request_headers(),
             )
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             logger.error("API request failed", exc_info=True)
             raise RuntimeError("Failed to get collection from NMDC API") from e
         else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API request response: %s\n API Status Code: %s",
+                    response.text,
+                    response.status_code,
+                )
 
         results = response.json()["resources"]
         # otherwise, get all pages
@@ -206,7 +209,7 @@ class CollectionSearch(NMDCSearch):
             filter = (
                 f'{{"{attribute_name}":{{"$regex":"{escaped_value}","$options":"i"}}}}'
             )
-        logging.debug(f"get_record_by_attribute Filter: {filter}")
+        logger.debug("get_record_by_attribute Filter: %s", filter)
         results = self.get_records(
             filter, max_page_size, fields, all_pages, shape=shape
         )
@@ -265,16 +268,15 @@ class CollectionSearch(NMDCSearch):
         if collection_id:
             record_id = collection_id
 
-        url = f"{self.api_base_url}/nmdcschema/{self.collection_name}/{record_id}"
+        url = f"{self._collection_url}/{record_id}"
         params: dict[str, QueryParamValue] = {
             "max_page_size": max_page_size,
             "projection": fields,
         }
         # get the reponse
         try:
-            response = requests.get(
+            response = self._session.get(
                 url=url,
-                headers=self._build_http_request_headers(),
                 params=params,
             )
             response.raise_for_status()
@@ -282,9 +284,12 @@ class CollectionSearch(NMDCSearch):
             logger.error("API request failed", exc_info=True)
             raise RuntimeError("Failed to get collection by id from NMDC API") from e
         else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API request response: %s\n API Status Code: %s",
+                    response.text,
+                    response.status_code,
+                )
         results = response.json()
         if shape == "dataframe":
             if isinstance(results, dict):
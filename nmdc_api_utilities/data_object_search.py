@@ -58,18 +58,20 @@ class DataObjectSearch(CollectionSearch):
 
         url = f"{self.api_base_url}/data_objects/study/{study_id}"
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
-                headers=self._build_http_request_headers(),
             )
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             logger.error("API request failed", exc_info=True)
             raise RuntimeError("Failed to get data_objects from NMDC API") from e
         else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API request response: %s\n API Status Code: %s",
+                    response.text,
+                    response.status_code,
+                )
 
         results = response.json()
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-import json
 import logging
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import quote
 
 import requests
 
@@ -13,10 +13,10 @@ from nmdc_api_utilities.decorators import has_deprecated_parameter, requires_aut
 logger = logging.getLogger(__name__)
 
 
-@has_deprecated_parameter("env", reason="Use ``api_base_url`` instead.")
-class JGISequencingProjectAPI(NMDCAPIClient):
+class _WfFileStagingAPI(NMDCAPIClient):
     """
-    Class to interact with the NMDC API to get JGI samples.
+    Base class for the clients of the NMDC API's ``wf_file_staging`` collections, which differ only
+    in the collection they access (``collection_name``).
 
     Parameters
     ----------
@@ -28,6 +28,8 @@ class JGISequencingProjectAPI(NMDCAPIClient):
         Deprecated. Use ``api_base_url`` instead. Previously used to specify the API environment (e.g., "prod", "dev").
     """
 
+    collection_name: str
+
     def __init__(
         self,
         auth: NMDCAuth,
@@ -41,14 +43,128 @@ class JGISequencingProjectAPI(NMDCAPIClient):
             api_base_url=api_base_url,
             env=env,
         )
+        # Every request sends and receives JSON, so set those headers on the session once.
+        self._session.headers.update(
+            self._build_http_request_headers(
+                accept="application/json", content_type="application/json"
+            )
+        )
+        self._url = f"{self.api_base_url}/wf_file_staging/{self.collection_name}"
         # make sure the `api_base_url` is the same
         # TODO: Use a global "settings" object to store the `api_base_url` in a single place.
         #       Example: https://github.com/pydantic/pydantic-settings
         if self.auth.api_base_url != self.api_base_url:
             raise ValueError(
-                "`api_base_url` must be the same for NMDCAuth and JGISequencingProjectAPI"
+                f"`api_base_url` must be the same for NMDCAuth and {type(self).__name__}"
             )
 
+    def _send(
+        self, send: Callable[[], requests.Response], error_message: str
+    ) -> requests.Response:
+        """
+        Sends a request by calling ``send``, raising a ``RuntimeError`` with the specified message
+        if the request fails.
+        """
+        try:
+            response = send()
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise RuntimeError(error_message) from e
+        else:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API request response: %s\n API Status Code: %s",
+                    response.text,
+                    response.status_code,
+                )
+        return response
+
+    def _record_url(self, record_id: str) -> str:
+        """Returns the URL of the record having the specified ID."""
+        return f"{self._url}/{quote(record_id, safe='')}"
+
+    def _list_records(
+        self,
+        filter: str | dict[str, Any] | None,
+        max_page_size: int,
+        fields: str,
+        all_pages: bool,
+        error_message: str,
+    ) -> list[dict[str, Any]]:
+        """Lists the records in this instance's collection that match the filter."""
+        # Get the access token once and reuse it for every page we request.
+        token = self.auth.get_token()
+        self._set_session_access_token(token)
+        encoded_filter = self._encode_filter(filter)
+        query_params: dict[str, str | int] = {
+            "max_page_size": max_page_size,
+            "projection": fields,
+        }
+        if encoded_filter:
+            query_params["filter"] = encoded_filter
+        if not all_pages:
+            response = self._send(
+                lambda: self._conditional_get(self._url, params=query_params),
+                error_message,
+            )
+            return response.json()["resources"]
+
+        # Note: When getting all pages, the first page is always downloaded afresh. The server
+        #       issues a new `next_page_token` with every response, so the token in a revalidated
+        #       (cached) first page may no longer be accepted.
+        response = self._send(
+            lambda: self._session.get(self._url, params=query_params),
+            error_message,
+        )
+        return self._get_all_pages(
+            response,
+            self._url,
+            encoded_filter,
+            max_page_size,
+            fields,
+            access_token=token,
+        )["resources"]
+
+    def _get_record(self, record_id: str, error_message: str) -> dict:
+        """Gets the record having the specified ID from this instance's collection."""
+        self._set_session_access_token(self.auth.get_token())
+        url = self._record_url(record_id)
+        return self._send(lambda: self._conditional_get(url), error_message).json()
+
+    def _create_record(self, record: dict, error_message: str) -> dict:
+        """Adds the specified record to this instance's collection."""
+        self._set_session_access_token(self.auth.get_token())
+        return self._send(
+            lambda: self._session.post(self._url, json=record), error_message
+        ).json()
+
+    def _update_record(self, record_id: str, record: dict, error_message: str) -> dict:
+        """Updates the record having the specified ID in this instance's collection."""
+        self._set_session_access_token(self.auth.get_token())
+        url = self._record_url(record_id)
+        return self._send(
+            lambda: self._session.patch(url, json=record), error_message
+        ).json()
+
+
+@has_deprecated_parameter("env", reason="Use ``api_base_url`` instead.")
+class JGISequencingProjectAPI(_WfFileStagingAPI):
+    """
+    Class to interact with the NMDC API to get JGI samples.
+
+    Parameters
+    ----------
+    auth
+        The NMDCAuth instance containing the credentials and API base URL for authentication.
+    api_base_url
+        The base URL of an instance of the NMDC Runtime API. By default, this is the base URL of the production instance.
+    env
+        Deprecated. Use ``api_base_url`` instead. Previously used to specify the API environment (e.g., "prod", "dev").
+    """
+
+    collection_name = "jgi_sequencing_projects"
+
     @requires_auth
     def create_jgi_sequencing_project(
         self,
@@ -74,30 +190,14 @@ class JGISequencingProjectAPI(NMDCAPIClient):
         Exception
             If the creation fails.
         """
-
-        url = f"{self.api_base_url}/wf_file_staging/jgi_sequencing_projects"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
+        return self._create_record(
+            jgi_sequencing_project, "Failed to add new JGI sequencing project"
         )
-        try:
-            response = requests.post(url, headers=headers, json=jgi_sequencing_project)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to add new JGI sequencing project") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
-
-        return response.json()
 
     @requires_auth
     def list_jgi_sequencing_projects(
         self,
-        filter: str | None = None,
+        filter: str | dict[str, Any] | None = None,
         max_page_size: int = 20,
         fields: str = "",
         all_pages: bool = False,
@@ -108,7 +208,7 @@ class JGISequencingProjectAPI(NMDCAPIClient):
         Parameters
         ----------
         filter
-            Filter to apply to the API call.
+            Filter to apply to the API call, as a dictionary or a JSON-encoded string.
         max_page_size
             The maximum number of items to return per page.
         fields
@@ -121,40 +221,13 @@ class JGISequencingProjectAPI(NMDCAPIClient):
         list
             The list of JGI sequencing projects.
         """
-        url = f"{self.api_base_url}/wf_file_staging/jgi_sequencing_projects"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
+        return self._list_records(
+            filter,
+            max_page_size,
+            fields,
+            all_pages,
+            "Failed to retrieve JGI sequencing projects",
         )
-        try:
-            # Note: The `dict` is here to appease mypy, which, for some reason, doesn't infer that
-            #       the dictionary being assigned here is sufficient to pass to `requests.get`.
-            query_params: dict = {
-                "filter": f"{json.dumps(filter)}",
-                "max_page_size": max_page_size,
-                "projection": fields,
-            }
-            response = requests.get(url, headers=headers, params=query_params)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to retrieve JGI sequencing projects") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
-        if all_pages:
-            return self._get_all_pages(
-                response,
-                url,
-                filter or "",
-                max_page_size,
-                fields,
-                access_token=self.auth.get_token(),
-            )["resources"]
-
-        return response.json()["resources"]
 
     @requires_auth
     def get_jgi_sequencing_project_by_name(self, project_name: str) -> dict:
@@ -171,28 +244,13 @@ class JGISequencingProjectAPI(NMDCAPIClient):
         dict
             The JGI sequencing project record.
         """
-        url = f"{self.api_base_url}/wf_file_staging/jgi_sequencing_projects/{project_name}"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
+        return self._get_record(
+            project_name, "Failed to retrieve JGI sequencing project"
         )
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to retrieve JGI sequencing project") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
-
-        return response.json()
 
 
 @has_deprecated_parameter("env", reason="Use ``api_base_url`` instead.")
-class JGISampleSearchAPI(NMDCAPIClient):
+class JGISampleSearchAPI(_WfFileStagingAPI):
     """
     Class to interact with the NMDC API to get JGI samples.
 
@@ -206,31 +264,12 @@ class JGISampleSearchAPI(NMDCAPIClient):
         Deprecated. Use ``api_base_url`` instead. Previously used to specify the API environment (e.g., "prod", "dev").
     """
 
-    def __init__(
-        self,
-        auth: NMDCAuth,
-        api_base_url: str = API_BASE_URL,
-        env: str = "",
-    ):
-        self.auth = auth
-        if not self.auth.has_credentials():
-            raise ValueError("credentials must be provided")
-        super().__init__(
-            api_base_url=api_base_url,
-            env=env,
-        )
-        # make sure the `api_base_url` is the same
-        # TODO: Use a global "settings" object to store the `api_base_url` in a single place.
-        #       Example: https://github.com/pydantic/pydantic-settings
-        if self.auth.api_base_url != self.api_base_url:
-            raise ValueError(
-                "`api_base_url` must be the same for NMDCAuth and JGISampleSearchAPI"
-            )
+    collection_name = "jgi_samples"
 
     @requires_auth
     def list_jgi_samples(
         self,
-        filter: str | None = None,
+        filter: str | dict[str, Any] | None = None,
         max_page_size: int = 20,
         fields: str = "",
         all_pages: bool = False,
@@ -241,7 +280,7 @@ class JGISampleSearchAPI(NMDCAPIClient):
         Parameters
         ----------
         filter
-            Filter to apply to the API call.
+            Filter to apply to the API call, as a dictionary or a JSON-encoded string.
         max_page_size
             The maximum number of items to return per page.
         fields
@@ -254,42 +293,9 @@ class JGISampleSearchAPI(NMDCAPIClient):
         list[dict]
             The list of JGI sample records.
         """
-        url = f"{self.api_base_url}/wf_file_staging/jgi_samples"
-        try:
-            query = filter if filter else {}
-            query_params: dict[str, str | int] = {
-                "filter": f"{json.dumps(query)}",
-                "max_page_size": max_page_size,
-                "projection": fields,
-            }
-            response = requests.get(
-                url,
-                headers=self._build_http_request_headers(
-                    access_token=self.auth.get_token(),
-                    accept="application/json",
-                    content_type="application/json",
-                ),
-                params=query_params,
-            )
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to retrieve JGI samples") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
-        if all_pages:
-            return self._get_all_pages(
-                response,
-                url,
-                filter or "",
-                max_page_size,
-                fields,
-                self.auth.get_token(),
-            )["resources"]
-
-        return response.json()["resources"]
+        return self._list_records(
+            filter, max_page_size, fields, all_pages, "Failed to retrieve JGI samples"
+        )
 
     @requires_auth
     def insert_jgi_sample(
@@ -316,24 +322,42 @@ class JGISampleSearchAPI(NMDCAPIClient):
         Exception
             If the insertion fails.
         """
-        url = f"{self.api_base_url}/wf_file_staging/jgi_samples"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
-        )
-        try:
-            response = requests.post(url, headers=headers, json=jgi_sample)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to insert JGI samples") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
+        return self._create_record(jgi_sample, "Failed to insert JGI samples")
+
+    @requires_auth
+    def insert_jgi_samples_batch(
+        self,
+        jgi_samples: list[dict],
+        max_workers: int = 4,
+    ) -> list[dict]:
+        """
+        Insert several JGI samples into the NMDC database.
+
+        The API accepts one sample per request, so the requests are sent concurrently over this
+        instance's pooled connections, rather than one after another as when calling
+        ``insert_jgi_sample`` in a loop.
+
+        Parameters
+        ----------
+        jgi_samples
+            The JGI sample data to be inserted.
+        max_workers
+            The maximum number of requests in flight at once. Default is 4.
 
-        return response.json()
+        Returns
+        -------
+        list[dict]
+            The responses from the insertion operations, in the same order as ``jgi_samples``.
+
+        Raises
+        ------
+        RuntimeError
+            If any insertion fails. Samples that were inserted successfully are not removed.
+        """
+        # Get the access token before fanning out, so the workers reuse the cached token rather
+        # than each requesting a new one at the same time.
+        self._set_session_access_token(self.auth.get_token())
+        return self._map_concurrently(self.insert_jgi_sample, jgi_samples, max_workers)
 
     @requires_auth
     def update_jgi_sample(
@@ -363,28 +387,13 @@ class JGISampleSearchAPI(NMDCAPIClient):
         Exception
             If the update fails.
         """
-        url = f"{self.api_base_url}/wf_file_staging/jgi_samples/{jgi_file_id}"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
+        return self._update_record(
+            jgi_file_id, jgi_sample, "Failed to update JGI samples"
         )
-        try:
-            response = requests.patch(url, headers=headers, json=jgi_sample)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to update JGI samples") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
-
-        return response.json()
 
 
 @has_deprecated_parameter("env", reason="Use ``api_base_url`` instead.")
-class GlobusTaskAPI(NMDCAPIClient):
+class GlobusTaskAPI(_WfFileStagingAPI):
     """
     Class to interact with the NMDC API for Globus tasks.
 
@@ -398,31 +407,12 @@ class GlobusTaskAPI(NMDCAPIClient):
         Deprecated. Use ``api_base_url`` instead. Previously used to specify the API environment (e.g., "prod", "dev").
     """
 
-    def __init__(
-        self,
-        auth: NMDCAuth,
-        api_base_url: str = API_BASE_URL,
-        env: str = "",
-    ):
-        self.auth = auth
-        if not self.auth.has_credentials():
-            raise ValueError("credentials must be provided")
-        super().__init__(
-            api_base_url=api_base_url,
-            env=env,
-        )
-        # make sure the `api_base_url` is the same
-        # TODO: Use a global "settings" object to store the `api_base_url` in a single place.
-        #       Example: https://github.com/pydantic/pydantic-settings
-        if self.auth.api_base_url != self.api_base_url:
-            raise ValueError(
-                "`api_base_url` must be the same for NMDCAuth and GlobusTaskAPI"
-            )
+    collection_name = "globus_tasks"
 
     @requires_auth
     def list_globus_tasks(
         self,
-        filter: str | None = None,
+        filter: str | dict[str, Any] | None = None,
         max_page_size: int = 20,
         fields: str = "",
         all_pages: bool = False,
@@ -433,7 +423,7 @@ class GlobusTaskAPI(NMDCAPIClient):
         Parameters
         ----------
         filter
-            Filter to apply to the API call.
+            Filter to apply to the API call, as a dictionary or a JSON-encoded string.
         max_page_size
             The maximum number of items to return per page.
         fields
@@ -446,37 +436,9 @@ class GlobusTaskAPI(NMDCAPIClient):
         list[dict]
             The list of Globus task records.
         """
-        url = f"{self.api_base_url}/wf_file_staging/globus_tasks"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
+        return self._list_records(
+            filter, max_page_size, fields, all_pages, "Failed to retrieve Globus tasks"
         )
-        query_params: dict[str, str | int] = {
-            "filter": f"{json.dumps(filter)}",
-            "max_page_size": max_page_size,
-            "projection": fields,
-        }
-        try:
-            response = requests.get(url, headers=headers, params=query_params)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to retrieve Globus tasks") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
-        if all_pages:
-            return self._get_all_pages(
-                response,
-                url,
-                filter or "",
-                max_page_size,
-                fields,
-                self.auth.get_token(),
-            )["resources"]
-        return response.json()["resources"]
 
     @requires_auth
     def create_globus_task(
@@ -503,25 +465,7 @@ class GlobusTaskAPI(NMDCAPIClient):
         Exception
             If the creation fails.
         """
-
-        url = f"{self.api_base_url}/wf_file_staging/globus_tasks"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
-        )
-        try:
-            response = requests.post(url, headers=headers, json=globus_task)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to add new Globus task") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
-
-        return response.json()
+        return self._create_record(globus_task, "Failed to add new Globus task")
 
     @requires_auth
     def update_globus_task(
@@ -551,21 +495,45 @@ class GlobusTaskAPI(NMDCAPIClient):
         Exception
             If the update fails.
         """
-        url = f"{self.api_base_url}/wf_file_staging/globus_tasks/{globus_task_id}"
-        headers = self._build_http_request_headers(
-            access_token=self.auth.get_token(),
-            accept="application/json",
-            content_type="application/json",
+        return self._update_record(
+            globus_task_id, globus_task, "Failed to update Globus task"
         )
-        try:
-            response = requests.patch(url, headers=headers, json=globus_task)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise RuntimeError("Failed to update Globus task") from e
-        else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
 
-        return response.json()
+    @requires_auth
+    def update_globus_tasks_batch(
+        self,
+        globus_tasks: dict[str, dict],
+        max_workers: int = 4,
+    ) -> list[dict]:
+        """
+        Update several Globus tasks in the NMDC database.
+
+        The API accepts one task per request, so the requests are sent concurrently over this
+        instance's pooled connections, rather than one after another as when calling
+        ``update_globus_task`` in a loop.
+
+        Parameters
+        ----------
+        globus_tasks
+            The Globus task data to be updated, keyed by Globus task ID.
+        max_workers
+            The maximum number of requests in flight at once. Default is 4.
+
+        Returns
+        -------
+        list[dict]
+            The updated Globus task records, in the same order as ``globus_tasks``.
+
+        Raises
+        ------
+        RuntimeError
+            If any update fails. Tasks that were updated successfully are not reverted.
+        """
+        # Get the access token before fanning out, so the workers reuse the cached token rather
+        # than each requesting a new one at the same time.
+        self._set_session_access_token(self.auth.get_token())
+        return self._map_concurrently(
+            lambda item: self.update_globus_task(*item),
+            list(globus_tasks.items()),
+            max_workers,
+        )
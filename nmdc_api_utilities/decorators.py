@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import inspect
 from collections.abc import Callable
 from functools import wraps
 from inspect import getdoc
@@ -16,37 +17,43 @@ class AuthenticationError(Exception):
 def requires_auth(f):
     """Decorator for methods that need authentication"""
 
-    @wraps(f)
-    def wrapper(self, *args, **kwargs):
-        # Get function parameter names (excluding 'self')
-        import inspect
+    def raise_authentication_error():
+        raise AuthenticationError(
+            f"{f.__name__} requires authentication. Either provide `client_id` and `client_secret` OR `username` and `password`."
+        )
+
+    if not f.__name__.startswith("mint"):
+
+        @wraps(f)
+        def wrapper(self, *args, **kwargs):
+            if not self.auth.has_credentials():
+                raise_authentication_error()
+            return f(self, *args, **kwargs)
 
-        sig = inspect.signature(f)
-        param_names = list(sig.parameters.keys())[1:]  # Skip 'self'
+        return wrapper
 
+    # Only `mint*` methods accept credentials as arguments. Get their parameter names (excluding
+    # 'self') once, here, rather than inspecting the function's signature on every call.
+    param_names = list(inspect.signature(f).parameters.keys())[1:]
+
+    @wraps(f)
+    def mint_wrapper(self, *args, **kwargs):
         # Create a dictionary of all arguments (positional + keyword)
-        bound_args = {}
-        for i, arg in enumerate(args):
-            if i < len(param_names):
-                bound_args[param_names[i]] = arg
+        bound_args = dict(zip(param_names, args))
         bound_args.update(kwargs)
 
-        # Check if client_id and client_secret are provided
-        client_id = bound_args.get("client_id")
-        client_secret = bound_args.get("client_secret")
-
-        if f.__name__.startswith("mint"):
-            # If client_id and client_secret are provided, we can use them
-            if client_id is not None and client_secret is not None:
-                # Credentials provided in function call, proceed
-                return f(self, *args, **kwargs)
+        # If client_id and client_secret are provided, we can use them
+        if (
+            bound_args.get("client_id") is not None
+            and bound_args.get("client_secret") is not None
+        ):
+            # Credentials provided in function call, proceed
+            return f(self, *args, **kwargs)
         if not self.auth.has_credentials():
-            raise AuthenticationError(
-                f"{f.__name__} requires authentication. Either provide `client_id` and `client_secret` OR `username` and `password`."
-            )
+            raise_authentication_error()
         return f(self, *args, **kwargs)
 
-    return wrapper
+    return mint_wrapper
 
 
 def has_deprecated_parameter(
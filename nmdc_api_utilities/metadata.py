@@ -2,8 +2,6 @@
 import json
 import logging
 
-import requests
-
 from nmdc_api_utilities.api_client import NMDCAPIClient
 from nmdc_api_utilities.auth import NMDCAuth
 from nmdc_api_utilities.config import API_BASE_URL
@@ -76,7 +74,7 @@ class Metadata(NMDCAPIClient):
             accept="application/json",
             content_type="application/json",
         )
-        response = requests.post(url, headers=headers, json=data)
+        response = self._session.post(url, headers=headers, json=data)
         if response.text != '{"result":"All Okay!"}' or response.status_code != 200:
             logging.error(f"Validation failed.")
             raise Exception(
@@ -124,7 +122,7 @@ class Metadata(NMDCAPIClient):
             accept="application/json",
             content_type="application/json",
         )
-        response = requests.post(url, headers=headers, json=json_records)
+        response = self._session.post(url, headers=headers, json=json_records)
 
         # error handling
         if response.status_code != 200:
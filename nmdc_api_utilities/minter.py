@@ -95,7 +95,7 @@ class Minter(NMDCAPIClient):
         url = f"{self.api_base_url}/pids/mint"
         payload = {"schema_class": {"id": nmdc_type}, "how_many": count}
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=self._build_http_request_headers(
                     access_token=token,
@@ -108,9 +108,12 @@ class Minter(NMDCAPIClient):
             logger.error("API request failed", exc_info=True)
             raise RuntimeError("Failed to mint new identifier from NMDC API") from e
         else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API request response: %s\n API Status Code: %s",
+                    response.text,
+                    response.status_code,
+                )
         # return the response
         response_data = response.json()
         if count == 1:
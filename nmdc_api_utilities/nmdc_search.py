@@ -85,10 +85,9 @@ class NMDCSearch(NMDCAPIClient):
                 "hydrate": hydrate,
                 "max_page_size": max_page_size,
             }
-            response = requests.get(
+            response = self._session.get(
                 url=url,
                 params=params,
-                headers=self._build_http_request_headers(),
             )
             if response.status_code == 200:
                 batch_resources = response.json().get("resources", [])
@@ -101,10 +100,9 @@ class NMDCSearch(NMDCAPIClient):
                             "ids": batch,
                             "page_token": next_page,
                         }
-                        response = requests.get(
+                        response = self._session.get(
                             url=url,
                             params=params,
-                            headers=self._build_http_request_headers(),
                         )
                         if response.status_code == 200:
                             batch_resources = response.json().get("resources", [])
@@ -196,15 +194,18 @@ class NMDCSearch(NMDCAPIClient):
         """
         url = f"{self.api_base_url}/nmdcschema/ids/{doc_id}/collection-name"
         try:
-            response = requests.get(url, headers=self._build_http_request_headers())
+            response = self._session.get(url)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             logger.error("API request failed", exc_info=True)
             raise RuntimeError("Failed to get record name from NMDC API") from e
         else:
-            logging.debug(
-                f"API request response: {response.json()}\n API Status Code: {response.status_code}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API request response: %s\n API Status Code: %s",
+                    response.text,
+                    response.status_code,
+                )
 
         collection_name = response.json()["collection_name"]
         return collection_name
@@ -277,7 +278,7 @@ class NMDCSearch(NMDCAPIClient):
 
         url = f"{self.api_base_url}/version"
         try:
-            response = requests.get(url, headers=self._build_http_request_headers())
+            response = self._session.get(url)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             logger.error("API request failed", exc_info=True)
@@ -309,10 +310,9 @@ class NMDCSearch(NMDCAPIClient):
             "projection": fields,
         }
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
                 params=params,
-                headers=self._build_http_request_headers(),
             )
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+import pytest
+
+from nmdc_api_utilities import DataProcessing
+
+
+def test_map_lookup():
+    dp = DataProcessing()
+    df = pd.DataFrame({"id": ["a", "b", "c"], "value": [1, 2, 3]})
+    lookup = pd.DataFrame({"id": ["a", "b"], "name": ["alpha", "beta"]})
+    result = dp.map_lookup(df, "id", lookup.set_index("id")["name"])
+    assert result["name"].tolist()[:2] == ["alpha", "beta"]
+    assert pd.isna(result["name"].iloc[2])
+
+
+def test_map_lookup_duplicate_keys():
+    dp = DataProcessing()
+    df = pd.DataFrame({"id": ["a"]})
+    lookup = pd.Series(["alpha", "also alpha"], index=["a", "a"], name="name")
+    with pytest.raises(ValueError, match="unique keys"):
+        dp.map_lookup(df, "id", lookup)
+
+
+def test_join_on_index():
+    dp = DataProcessing()
+    df1 = pd.DataFrame({"id": ["a", "b", "c"], "x": [1, 2, 3]})
+    df2 = pd.DataFrame({"id": ["b", "c", "d"], "y": [20, 30, 40]})
+    expected = dp.merge_dataframes("id", df1, df2)
+    result = dp.join_on_index(df1, df2, "id")
+    pd.testing.assert_frame_equal(result, expected)
+    # a pre-indexed right-hand side gives the same result
+    result = dp.join_on_index(df1, df2.set_index("id"), "id")
+    pd.testing.assert_frame_equal(result, expected)
+    # columns other than the key that appear in both dataframes get suffixes, as with merge
+    df1 = pd.DataFrame({"id": ["a", "b"], "name": ["A", "B"], "x": [1, 2]})
+    df2 = pd.DataFrame({"id": ["b", "a"], "name": ["b2", "a2"], "y": [20, 10]})
+    expected = dp.merge_dataframes("id", df1, df2)
+    result = dp.join_on_index(df1, df2, "id")
+    assert result.columns.tolist() == ["id", "name_x", "x", "name_y", "y"]
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_merge_many():
+    dp = DataProcessing()
+    df1 = pd.DataFrame({"id": ["a", "b", "c"], "x": [1, 2, 3]})
+    df2 = pd.DataFrame({"id": ["b", "c"], "y": [20, 30]})
+    df3 = pd.DataFrame({"id": ["c", "b"], "z": [300, 200]})
+    result = dp.merge_many([df1, df2, df3], "id")
+    assert result["id"].tolist() == ["b", "c"]
+    assert result["z"].tolist() == [200, 300]
+
+
+def test_concat_dataframes():
+    dp = DataProcessing()
+    frames = [pd.DataFrame({"id": ["a"]}), pd.DataFrame({"id": ["b", "c"]})]
+    result = dp.concat_dataframes(frames)
+    assert result["id"].tolist() == ["a", "b", "c"]
+    assert result.index.tolist() == [0, 1, 2]
+    assert dp.concat_dataframes([]).empty
+
+
+def test_build_filter():
+    dp = DataProcessing()
+    assert (
+        dp.build_filter({"name": "GC-MS (2009)"})
+        == r'{"name":{"$regex":"GC\\-MS\\ \\(2009\\)","$options":"i"}}'
+    )
+
+
+def test_build_filter_exact_match():
+    dp = DataProcessing()
+    assert (
+        dp.build_filter({"name": "Bob's soil", "id": "nmdc:bsm-1"}, exact_match=True)
+        == '{"name":"Bob\'s soil","id":"nmdc:bsm-1"}'
+    )
+    assert dp.build_filter({}, exact_match=True) == "{}"
+
+
+def test_merge_df():
+    dp = DataProcessing()
+    df1 = pd.DataFrame({"id": ["a", "b"], "study": [["s1", "s2"], ["s1"]]})
+    df2 = pd.DataFrame({"study_id": ["s1", "s2"], "name": ["one", "two"]})
+    expected = pd.DataFrame(
+        {
+            "id": ["a", "b", "a"],
+            "study": ["s1", "s1", "s2"],
+            "study_id": ["s1", "s1", "s2"],
+            "name": ["one", "one", "two"],
+        }
+    )
+    result = dp.merge_df(df1, df2, "study", "study_id")
+    assert sorted(result.itertuples(index=False)) == sorted(
+        expected.itertuples(index=False)
+    )
+    # naming the list columns up front gives the same result
+    result = dp.merge_df(
+        df1, df2, "study", "study_id", list_cols1=["study"], list_cols2=[]
+    )
+    assert sorted(result.itertuples(index=False)) == sorted(
+        expected.itertuples(index=False)
+    )
+
+
+def test_convert_to_df_columns():
+    dp = DataProcessing()
+    data = [{"id": "a", "name": "alpha", "extra": 1}, {"id": "b"}]
+    df = dp.convert_to_df(data, columns=["id", "name"])
+    assert df.columns.tolist() == ["id", "name"]
+    assert df["id"].tolist() == ["a", "b"]
+    assert pd.isna(df["name"].iloc[1])
+    assert dp.convert_to_df(data).columns.tolist() == ["id", "name", "extra"]
+
+
+def test_merge_df_drops_duplicates():
+    dp = DataProcessing()
+    df1 = pd.DataFrame({"id": ["a", "a", "b"], "study": ["s1", "s1", "s1"]})
+    df2 = pd.DataFrame({"study_id": ["s1", "s1"], "name": ["one", "one"]})
+    result = dp.merge_df(df1, df2, "study", "study_id")
+    assert len(result) == 2
+    assert not result.duplicated().any()
+
+
+def test_build_filter_list_values():
+    dp = DataProcessing()
+    expected = '{"ecosystem_category":{"$in":["Plants","Terrestrial"]},"name":"soil"}'
+    attributes = {"ecosystem_category": ["Plants", "Terrestrial"], "name": "soil"}
+    assert dp.build_filter(attributes, exact_match=True) == expected
+    assert dp.build_filter(attributes).startswith(
+        '{"ecosystem_category":{"$in":["Plants","Terrestrial"]},"name":{"$regex"'
+    )
+
+
+def test_build_filter_mapping_of_sequences():
+    dp = DataProcessing()
+    attributes = {"ecosystem_category": ("Plants",), "name": "soil"}
+    result = dp.build_filter(attributes)
+    assert (
+        result
+        == '{"ecosystem_category":{"$in":["Plants"]},"name":{"$regex":"soil","$options":"i"}}'
+    )
+    assert (
+        dp.build_filter({"a": "x", "b": "y"}, exact_match=True) == '{"a":"x","b":"y"}'
+    )
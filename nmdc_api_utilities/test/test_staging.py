@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 # Note: Before we switched from the `env` kwarg to the `api_base_url` kwarg, all of the occurrences
 #       of the `env` kwarg in this module were being set to `"dev"`. When we switched to the
 #       `api_base_url` kwarg, we set their values to whatever the `API_BASE_URL` environment
 #       variable contained (which, by default, is the base URL of the production NMDC Runtime API).
+from nmdc_api_utilities.auth import NMDCAuth
 from nmdc_api_utilities.config import API_BASE_URL
 from nmdc_api_utilities.data_staging import (
     GlobusTaskAPI,
@@ -17,19 +20,19 @@ from nmdc_api_utilities.data_staging import (
 
 @pytest.fixture
 def mock_get_response():
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         yield mock_get
 
 
 @pytest.fixture
 def mock_post_response():
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         yield mock_post
 
 
 @pytest.fixture
 def mock_patch_response():
-    with patch("requests.patch") as mock_patch:
+    with patch("requests.Session.patch") as mock_patch:
         yield mock_patch
 
 
@@ -134,3 +137,157 @@ def test_update_globus_task(mock_auth, mock_patch_response):
         "54321", {"task_id": "54321", "task_status": "ACTIVE"}
     )
     assert result == {"resources": {"task_id": "54321", "task_status": "ACTIVE"}}
+
+
+def test_list_sequencing_projects_all_pages(mock_auth, mock_get_response):
+    first_page, second_page = MagicMock(), MagicMock()
+    first_page.json.return_value = {
+        "resources": [{"key1": "value1"}],
+        "next_page_token": "abc",
+    }
+    second_page.json.return_value = {"resources": [{"key2": "value2"}]}
+    mock_get_response.side_effect = [first_page, second_page]
+    client = JGISequencingProjectAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    result = client.list_jgi_sequencing_projects(all_pages=True)
+    assert result == [{"key1": "value1"}, {"key2": "value2"}]
+    assert mock_get_response.call_count == 2
+    assert mock_get_response.call_args.kwargs["params"]["page_token"] == "abc"
+
+
+def test_list_jgi_samples_all_pages_gets_token_once(mock_auth, mock_get_response):
+    first_page, second_page = MagicMock(), MagicMock()
+    first_page.json.return_value = {"resources": [{"a": 1}], "next_page_token": "abc"}
+    second_page.json.return_value = {"resources": [{"b": 2}]}
+    mock_get_response.side_effect = [first_page, second_page]
+    client = JGISampleSearchAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    result = client.list_jgi_samples(all_pages=True)
+    assert result == [{"a": 1}, {"b": 2}]
+    mock_auth.get_token.assert_called_once()
+
+
+def test_session_headers(mock_auth, mock_post_response):
+    mock_auth.get_token.return_value = "abcd123"
+    client = GlobusTaskAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    assert client._session.headers["Accept"] == "application/json"
+    assert client._session.headers["Content-Type"] == "application/json"
+    client.create_globus_task({"task_id": "54321"})
+    assert client._session.headers["Authorization"] == "Bearer abcd123"
+
+
+def test_get_sequencing_project_revalidates_with_etag(mock_auth, mock_get_response):
+    first_response = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+    first_response.json.return_value = {"sequencing_project_name": "project"}
+    not_modified_response = MagicMock(status_code=304, headers={})
+    mock_get_response.side_effect = [first_response, not_modified_response]
+    client = JGISequencingProjectAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    first = client.get_jgi_sequencing_project_by_name("project")
+    second = client.get_jgi_sequencing_project_by_name("project")
+    assert first == second == {"sequencing_project_name": "project"}
+    assert mock_get_response.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_list_jgi_samples_all_pages_does_not_revalidate_first_page(
+    mock_auth, mock_get_response
+):
+    def make_page(resources, next_page_token):
+        page = MagicMock(status_code=200, headers={"ETag": f'"{next_page_token}"'})
+        page.json.return_value = {
+            "resources": resources,
+            "next_page_token": next_page_token,
+        }
+        return page
+
+    fresh_pages = [
+        make_page([{"a": 1}], "token1"),
+        make_page([{"b": 2}], None),
+        make_page([{"a": 1}], "token2"),
+        make_page([{"b": 2}], None),
+    ]
+
+    def get(url, params=None, headers=None):
+        # Like the server, answer a request carrying a validator with "304 Not Modified".
+        if headers and "If-None-Match" in headers:
+            return MagicMock(status_code=304, headers={})
+        return fresh_pages.pop(0)
+
+    mock_get_response.side_effect = get
+    client = JGISampleSearchAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    assert client.list_jgi_samples(all_pages=True) == [{"a": 1}, {"b": 2}]
+    assert client.list_jgi_samples(all_pages=True) == [{"a": 1}, {"b": 2}]
+    # The second listing continued with the page token issued for it, not the earlier one.
+    assert mock_get_response.call_args.kwargs["params"]["page_token"] == "token2"
+    assert not fresh_pages
+
+
+def test_insert_jgi_samples_batch(mock_auth, mock_post_response):
+    mock_post_response.side_effect = lambda url, json: MagicMock(
+        **{"json.return_value": {"inserted": json["jdp_file_id"]}}
+    )
+    client = JGISampleSearchAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    samples = [{"jdp_file_id": str(i)} for i in range(10)]
+    result = client.insert_jgi_samples_batch(samples)
+    assert result == [{"inserted": str(i)} for i in range(10)]
+    assert mock_post_response.call_count == 10
+
+
+def test_update_globus_tasks_batch_raises(mock_auth, mock_patch_response):
+    failed_response = MagicMock()
+    failed_response.raise_for_status.side_effect = requests.HTTPError("boom")
+    mock_patch_response.side_effect = lambda url, json: (
+        failed_response if url.endswith("/2") else MagicMock()
+    )
+    client = GlobusTaskAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    with pytest.raises(RuntimeError, match="Failed to update Globus task"):
+        client.update_globus_tasks_batch({str(i): {} for i in range(5)})
+    assert mock_patch_response.call_count == 5
+
+
+def test_update_jgi_sample_quotes_file_id(mock_auth, mock_patch_response):
+    client = JGISampleSearchAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    client.update_jgi_sample("a/b c", {"sample": "value"})
+    assert (
+        mock_patch_response.call_args.args[0]
+        == f"{API_BASE_URL}/wf_file_staging/jgi_samples/a%2Fb%20c"
+    )
+
+
+def test_list_globus_tasks_filter_encoding(mock_auth, mock_get_response):
+    first_page, second_page = MagicMock(), MagicMock()
+    first_page.json.return_value = {"resources": [], "next_page_token": "token2"}
+    second_page.json.return_value = {"resources": [], "next_page_token": None}
+    mock_get_response.side_effect = [first_page, second_page]
+    client = GlobusTaskAPI(api_base_url=API_BASE_URL, auth=mock_auth)
+    client.list_globus_tasks({"task_status": "ACTIVE"}, all_pages=True)
+    for call in mock_get_response.call_args_list:
+        assert call.kwargs["params"]["filter"] == '{"task_status":"ACTIVE"}'
+
+    mock_get_response.side_effect = None
+    mock_get_response.return_value.json.return_value = {"resources": []}
+    client.list_globus_tasks('{"task_status":"ACTIVE"}')
+    assert mock_get_response.call_args.kwargs["params"]["filter"] == (
+        '{"task_status":"ACTIVE"}'
+    )
+    client.list_globus_tasks()
+    assert "filter" not in mock_get_response.call_args.kwargs["params"]
+
+
+def test_insert_jgi_samples_batch_gets_token_once(mock_post_response):
+    token_response = MagicMock()
+    token_response.json.return_value = {
+        "access_token": "abcd123",
+        "expires": {"minutes": 30},
+    }
+    auth = NMDCAuth(client_id="test", client_secret="test", api_base_url=API_BASE_URL)
+
+    def slow_token_post(*args, **kwargs):
+        # Keep the token request in flight long enough for concurrent workers to overlap with it.
+        time.sleep(0.05)
+        return token_response
+
+    with patch(
+        "nmdc_api_utilities.auth.requests.post", side_effect=slow_token_post
+    ) as mock_token_post:
+        client = JGISampleSearchAPI(api_base_url=API_BASE_URL, auth=auth)
+        client.insert_jgi_samples_batch([{"jdp_file_id": str(i)} for i in range(10)])
+    mock_token_post.assert_called_once()
+    assert mock_post_response.call_count == 10